@@ -1,5 +1,6 @@
 import nixio
 import logging
+import numpy as np
 from tqdm import tqdm
 
 from .trace_container import TraceContainer, TimeReference
@@ -96,8 +97,24 @@ class ReProRun(TraceContainer):
     def stimulus_count(self):
         return len(self._stimuli)
 
+    def stimulus_metadata_values(self, key):
+        """Collect the values of a scalar stimulus setting for all stimuli of this repro run in a single pass.
+
+        Parameters
+        ----------
+        key : str
+            The name of the property in the stimulus metadata, e.g. "Frequency".
+
+        Returns
+        -------
+        numpy.ndarray
+            The values, one entry per stimulus presentation.
+        """
+        return np.fromiter((s.metadata[s.name][key][0][0] for s in self._stimuli),
+                           dtype=np.float64, count=len(self._stimuli))
+
     def trace_data(self, name, reference=TimeReference.Zero):
-        """Get the data that was recorded while this repro was run.
+        """Get the data that was recorded while this repro was run. The returned arrays are served from a shared buffer and may be read-only; copy them before modifying them in place.
 
         Paramters
         ---------
@@ -172,7 +172,7 @@ class Stimulus(TraceContainer):
         return feat
 
     def trace_data(self, name, before=0.0, after=0.0, reference=TimeReference.Zero):
-        """Get the data that was recorded while this stimulus was put out. With before and after, the timespan can be extended. 'before' must not be larger than the delay, stimulus stop + after must not reach into the next stimulus start. They will be automatically adjusted.
+        """Get the data that was recorded while this stimulus was put out. With before and after, the timespan can be extended. 'before' must not be larger than the delay, stimulus stop + after must not reach into the next stimulus start. They will be automatically adjusted. The returned arrays are served from a shared buffer and may be read-only; copy them before modifying them in place.
 
         Paramters
         ---------
@@ -1,10 +1,16 @@
 import nixio
 import numpy as np
 from enum import Enum
+from functools import cached_property
 import logging
 
 from ..utils.mappings import DataType, tag_start_and_extent
-from ..utils.buffers import FeatureBuffer
+from ..utils.buffers import FeatureBuffer, TraceDataBuffer
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 class TimeReference(Enum):
@@ -17,6 +23,76 @@ class TimeReference(Enum):
     Zero = 1
 
 
+# scale applied to the segment start time when shifting zero-referenced data
+# to the requested time reference
+_offset_scale = {TimeReference.Absolute: 1.0, TimeReference.Zero: 0.0}
+
+
+def _build_axis(n, dt, offset):
+    """Construct the time axis of a regularly sampled data slice, i.e. arange(n) * dt + offset in a single pass.
+
+    Parameters
+    ----------
+    n : int
+        The number of samples.
+    dt : float
+        The sampling interval.
+    offset : float
+        The time of the first sample.
+
+    Returns
+    -------
+    numpy.ndarray
+        The time axis.
+    """
+    time = np.arange(n, dtype=np.float64)
+    time *= dt
+    time += offset
+    return time
+
+
+if njit is not None:  # numba is optional, fall back to plain numpy without it
+    _build_axis = njit(cache=True, fastmath=True)(_build_axis)
+
+
+def _sampled_slice_indices(start_position, end_position, sampling_interval):
+    """Start index and sample count of a data slice on a regularly sampled trace. Mirrors the index arithmetic of nixio's SampledDimension.index_of so the result matches DataArray.get_slice in data slice mode.
+
+    Parameters
+    ----------
+    start_position : float
+        The start of the slice in data coordinates.
+    end_position : float
+        The end of the slice in data coordinates.
+    sampling_interval : float
+        The sampling interval of the trace.
+
+    Returns
+    -------
+    int
+        The index of the first sample.
+    int
+        The number of samples, zero if the requested range is empty.
+    """
+    start_scaled = start_position / sampling_interval
+    end_scaled = end_position / sampling_interval
+    if end_scaled < 0:
+        return 0, 0
+    index = int(np.round(start_scaled))
+    if start_scaled < 0:
+        start_index = 0
+    elif np.isclose(start_scaled, index) or index > start_scaled:
+        start_index = index
+    else:
+        start_index = index + 1
+    index = int(np.round(end_scaled))
+    if np.isclose(end_scaled, index) or index < end_scaled:
+        end_index = index
+    else:
+        end_index = index - 1
+    return start_index, max(end_index - start_index, 0)
+
+
 class TraceContainer(object):
     """Superclass for classes that are based on nix Tags/MultiTags. Provides some general properties and functions for accessing the data and some basic properties.
     """
@@ -41,15 +117,18 @@ class TraceContainer(object):
 
         self._tag = tag_or_mtag
         self._tag_id = tag_or_mtag.id
+        self._ref_names = frozenset(r.name for r in tag_or_mtag.references)
         self._tag_name = tag_or_mtag.name
         self._tag_type = tag_or_mtag.type
         self._mapping_version = relacs_nix_version
         self._index = index
         self._feature_buffer = FeatureBuffer()
-        self._features = None
+        self._trace_buffer = TraceDataBuffer()
         self._trace_map = traces
+        self._feature_slice = self._feature_slice_mtag if isinstance(tag_or_mtag, nixio.MultiTag) else self._feature_slice_tag
 
         self._start_time, self._duration = tag_start_and_extent(self._tag, self._index, self._mapping_version)
+        self._stop_time = self._start_time + self._duration
 
     @property
     def name(self) -> str:
@@ -116,7 +195,7 @@ class TraceContainer(object):
             The stimulus stop time.
 
         """
-        return self.start_time + self.duration
+        return self._stop_time
 
     @property
     def repro_tag(self):
@@ -129,7 +208,7 @@ class TraceContainer(object):
         """
         return self._tag
 
-    @property
+    @cached_property
     def traces(self) -> list:
         """The list of referenced event and data traces
 
@@ -141,13 +220,13 @@ class TraceContainer(object):
 
     def trace_info(self, trace_name):
         ti = None
-        if trace_name in self._trace_map.keys():
+        if trace_name in self._trace_map:
             ti = self._trace_map[trace_name]
         else:
             logging.error(f"TraceContainer: Key error, {trace_name} is not known trace name!")
         return ti
 
-    @property
+    @cached_property
     def features(self) -> list:
         """List of features associated with this repro run.
 
@@ -156,14 +235,11 @@ class TraceContainer(object):
         list of tuples
             index, name and type of t
         """
-        if self._features is None:
-            self._features = []
-            for i, feats in enumerate(self._tag.features):
-                self._features.append((i, feats.data.name, feats.data.type))
-        return self._features
+        feats = list(self._tag.features)
+        return [(i, f.data.name, f.data.type) for i, f in enumerate(feats)]
 
     def _trace_data(self, name, before=0.0, after=0.0, reference=TimeReference.Zero):
-        """Get the data that was recorded while this repro was run, the stimulus was put out.
+        """Get the data that was recorded while this repro was run, the stimulus was put out. The returned arrays are served from a shared buffer and may be read-only; copy them before modifying them in place.
 
         Paramters
         ---------
@@ -187,35 +263,59 @@ class TraceContainer(object):
             logging.warning(f"TraceContainer._trace_data: reading trace data from {name}, slice is invalid! start_time: {self.start_time} stop_time: {self.stop_time}. Interrupted stimulus?")
             return None, None
 
-        logging.debug(f"TraceContainer._trace_data: reading trace data from {name}, with time reference {reference}")
-        if name not in self._tag.references or name not in self._trace_map.keys():
+        logging.debug("TraceContainer._trace_data: reading trace data from %s, with time reference %s", name, reference)
+        if name not in self._ref_names or name not in self._trace_map:
             raise ValueError(f"Could not find {name} in the list of references.")
         ref = self._trace_map[name]
 
-        segment_stop_time = self.start_time + self.duration + after
+        max_time = ref.maximum_time
+        segment_stop_time = self._stop_time + after
 
-        if ref.trace_type == DataType.Continuous:
-            if segment_stop_time > ref.maximum_time:
-                after = ref.maximum_time - self.stop_time
-                logging.warning(f"traceContainer._trace_data: segment stop time ({np.round(segment_stop_time, 5)}) is too large, beyond maximum time in trace {ref.name} ({ref.maximum_time})! reduced after to {np.round(after, 5)}!")
-                segment_stop_time = self.start_time + self.duration + after
+        if ref.trace_type == DataType.Continuous and segment_stop_time > max_time:
+            after = max_time - self._stop_time
+            logging.warning(f"traceContainer._trace_data: segment stop time ({np.round(segment_stop_time, 5)}) is too large, beyond maximum time in trace {ref.name} ({max_time})! reduced after to {np.round(after, 5)}!")
+            segment_stop_time = max_time
 
-        logging.debug(f"TraceContainer._trace_data: get data slice from {np.round(self.start_time - before, 5)} to {np.round(segment_stop_time, 5)}")
+        logging.debug("TraceContainer._trace_data: get data slice from %.5f to %.5f", self.start_time - before, segment_stop_time)
 
-        try:
-            data = ref.data_array.get_slice([self.start_time - before], [self.duration + after + before], nixio.DataSliceMode.Data)[:]
-        except:
-            data = []
-        time = None
-
-        if ref.trace_type == DataType.Continuous:  
-            time = np.array(ref.data_array.dimensions[0].axis(len(data)))
-            if reference == TimeReference.Absolute:
-                time += (self.start_time - before)
+        cache_key = (self._tag_id, self._index, name, before, after)
+        if self._trace_buffer.has(cache_key):
+            data, time = self._trace_buffer.get(cache_key)
+        else:
+            time = None
+            if ref.trace_type == DataType.Continuous:
+                data_set = ref.data_set
+                # end position as nixio computes it in get_slice, position + extent,
+                # to keep the exact float summation order and thus the tie-break at
+                # half-sample boundaries
+                start_position = self.start_time - before
+                end_position = start_position + (self.duration + after + before)
+                start_index, count = _sampled_slice_indices(start_position, end_position, ref.sampling_interval)
+                if start_index >= data_set.shape[0]:
+                    logging.warning("TraceContainer._trace_data: requested slice of trace %s starts beyond the end of the trace!", name)
+                    count = 0
+                else:
+                    count = min(count, data_set.shape[0] - start_index)
+                data = np.empty(count, dtype=data_set.dtype)
+                data_set.read_direct(data, source_sel=np.s_[start_index:start_index + count])
+                time = _build_axis(count, ref.sampling_interval, -before)
+            else:  # event data, zero referenced to segment start
+                data_view = ref.data_array.get_slice([self.start_time - before], [self.duration + after + before], nixio.DataSliceMode.Data)
+                if data_view.valid:
+                    data = data_view[:]
+                else:
+                    logging.debug("TraceContainer._trace_data: no events in the requested range of trace %s.", name)
+                    data = np.empty(0, dtype=np.float64)
+                if self.start_time:
+                    np.subtract(data, self.start_time, out=data)
+            self._trace_buffer.put(cache_key, data, time)
+
+        offset = _offset_scale[reference] * self.start_time
+        if offset:
+            if time is None:
+                data = data + offset
             else:
-                time -= before
-        else:  # event data
-            data -=  0.0 if reference is TimeReference.Absolute else self.start_time
+                time = time + offset
         return data, time
 
     def feature_data(self, name):
@@ -230,11 +330,6 @@ class TraceContainer(object):
         -------
         numpy.ndarray
             The feature data.
-
-        Raises
-        ------
-        ValueError
-            If this container is a Stimulus and there is no position index stored, a ValueError is raised, should never happen.
         """
         buffered_data = None
         if self._feature_buffer.has(self.id, name):
@@ -243,16 +338,11 @@ class TraceContainer(object):
             buffered_data = self.repro_tag.features[name].data[:]
             self._feature_buffer.put(self.id, name, buffered_data)
 
-        if isinstance(self._tag, nixio.MultiTag) and self._index is not None:
-            logging.debug(f"reading feature data from {name} with index {self._index}")
-            feat_data = buffered_data[self._index]
-        elif isinstance(self._tag, nixio.Tag):
-            logging.debug(f"reading feature data from {name}")
-            feat_data = buffered_data
-        else:
-            raise ValueError(f"TraceContainer, feature_data: something went wrong, no Index? Tag: {self._tag}, Index:{self._index}")
+        logging.debug("reading feature data from %s", name)
+        return self._feature_slice(buffered_data)
 
-        if isinstance(feat_data, (nixio.DataArray, nixio.Feature)):
-            return feat_data[:]
-        else:
-            return feat_data
\ No newline at end of file
+    def _feature_slice_mtag(self, buffered_data):
+        return buffered_data[self._index]
+
+    def _feature_slice_tag(self, buffered_data):
+        return buffered_data
\ No newline at end of file
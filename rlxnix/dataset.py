@@ -8,12 +8,12 @@ from tqdm import tqdm
 from importlib import import_module
 
 from .base.stimulus import Stimulus
-from .utils.mappings import DataType, type_map
+from .utils.mappings import DataType, type_map, clear_position_buffer
 from .base.repro import ReProRun
 from .utils.timeline import Timeline
 from .utils.util import data_links_to_pandas, nix_metadata_to_dict
 from .utils.data_trace import DataTrace, TraceList
-from .utils.buffers import MetadataBuffer, FeatureBuffer
+from .utils.buffers import MetadataBuffer, FeatureBuffer, TraceDataBuffer
 
 
 def scan_plugins():
@@ -77,6 +77,7 @@ class Dataset(object):
         self._repro_map = {}
         self._metadata_buffer = MetadataBuffer()
         self._feature_buffer = FeatureBuffer()
+        self._trace_buffer = TraceDataBuffer()
 
         self._scan_file()
 
@@ -263,6 +264,8 @@ class Dataset(object):
         self._nixfile = None
         self._metadata_buffer.clear(False)
         self._feature_buffer.clear(False)
+        self._trace_buffer.clear(False)
+        clear_position_buffer()
 
     @property
     def is_open(self) -> bool:
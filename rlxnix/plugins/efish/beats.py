@@ -17,11 +17,10 @@ class Beats(EfishEphys):
 
         Returns
         -------
-        dfs: list of floats
+        dfs: numpy.ndarray
             The difference frequencies of the stimulus presentations in Hertz.
         """
-        dfs = [s.metadata[s.name]["DeltaF"][0][0] for s in self.stimuli]
-        return dfs
+        return self.stimulus_metadata_values("DeltaF")
 
     @property
     def frequencies(self):
@@ -29,11 +28,10 @@ class Beats(EfishEphys):
 
         Returns
         -------
-        freqs: list of floats
+        freqs: numpy.ndarray
             The absolute frequencies of the stimulus presentations in Hertz.
         """
-        freqs = [s.metadata[s.name]["Frequency"][0][0] for s in self.stimuli]
-        return freqs
+        return self.stimulus_metadata_values("Frequency")
 
     @property
     def pause(self):
@@ -1,7 +1,9 @@
 import nixio
 import logging
+import numpy as np
 
 from ...base.repro import ReProRun
+from ...base.trace_container import _build_axis, _sampled_slice_indices
 from ...utils.mappings import DataType
 from ...utils.config import Config
 
@@ -25,12 +27,79 @@ class EfishEphys(ReProRun):
         self._get_signal_trace_map()
 
     def _get_signal_trace_map(self):
+        traces_set = set(self.traces)
         for s in self.signals:
             signal_traces = self._config.trace_configuration(self.pluginset, s)
             if signal_traces is not None:
-                for t in self.traces:
-                    if t in signal_traces:
-                        self._signal_trace_map[s] = t
+                match = next((t for t in signal_traces if t in traces_set), None)
+                if match is not None:
+                    self._signal_trace_map[s] = match
+
+    def _stimuli_continuous_data(self, trace_name):
+        """Read the data of a continuous trace for all stimulus presentations with a single slice spanning the full repro run and cut out the per-stimulus snippets in memory.
+
+        Parameters
+        ----------
+        trace_name : str
+            The name of the continuous data trace.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            The data snippets, one per stimulus presentation.
+        list of numpy.ndarray
+            The respective time axes, zero at each stimulus onset.
+        """
+        if len(self.stimuli) == 0:
+            return [], []
+        ref = self._trace_map[trace_name]
+        dt = ref.sampling_interval
+        t0 = min(s.start_time for s in self.stimuli)
+        t1 = min(max(s.stop_time for s in self.stimuli), ref.maximum_time)
+        data_set = ref.data_set
+        offset_index, count = _sampled_slice_indices(t0, t1, dt)
+        if offset_index >= data_set.shape[0]:
+            logging.warning("EfishEphys._stimuli_continuous_data: requested slice of trace %s starts beyond the end of the trace!", trace_name)
+            count = 0
+        else:
+            count = min(count, data_set.shape[0] - offset_index)
+        data = np.empty(count, dtype=data_set.dtype)
+        data_set.read_direct(data, source_sel=np.s_[offset_index:offset_index + count])
+        snippets = []
+        times = []
+        for s in self.stimuli:
+            start_index, n = _sampled_slice_indices(s.start_time, min(s.stop_time, t1), dt)
+            start_index -= offset_index
+            n = max(min(n, count - start_index), 0)
+            snippets.append(data[start_index:start_index + n])
+            times.append(_build_axis(n, dt, 0.0))
+        return snippets, times
+
+    def _stimuli_event_data(self, trace_name):
+        """Read an event trace once and sort the events to the stimulus presentations in memory. Each stimulus gets the same events the per-stimulus trace_data call returns, i.e. nixio's range slicing that excludes the last event at or before the stimulus stop time.
+
+        Parameters
+        ----------
+        trace_name : str
+            The name of the event trace.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            The event times, one array per stimulus presentation, relative to the respective stimulus onset.
+        """
+        if len(self.stimuli) == 0:
+            return []
+        ref = self._trace_map[trace_name]
+        events = ref.data_set[:]
+        event_times = []
+        for s in self.stimuli:
+            i0 = int(np.searchsorted(events, s.start_time, side="left"))
+            i1 = int(np.searchsorted(events, s.stop_time, side="right")) - 1
+            if i1 < i0:
+                i1 = i0
+            event_times.append(events[i0:i1] - s.start_time)
+        return event_times
 
     def spikes(self, stimulus_index=None, trace_name=None):
         """Return the spike times for the whole repro run or during a certain stimulus presentation.
@@ -121,6 +190,70 @@ class EfishEphys(ReProRun):
         else:
             return self.trace_data(trace_name)
 
+    def eod_all(self, trace_name=None):
+        """Return the global eod measurement for every stimulus presentation. The trace is read from file only once with a single slice spanning all stimuli; the per-stimulus snippets are cut out in memory.
+
+        Parameters
+        ----------
+        trace_name : str, optional
+            The name of the eod trace, by default None, i.e. will try to read the default from the configuration.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            The eod snippets, one per stimulus presentation.
+        list of numpy.ndarray
+            The respective time axes, zero at each stimulus onset.
+        """
+        if trace_name is None:
+            trace_name = self._signal_trace_map.get("global eod")
+        if not self._check_trace(trace_name, data_type=DataType.Continuous):
+            logging.warning("EfishEphys.eod_all: the eod trace was not found!")
+            return None, None
+        return self._stimuli_continuous_data(trace_name)
+
+    def local_eod_all(self, trace_name=None):
+        """Return the local eod measurement for every stimulus presentation. The trace is read from file only once with a single slice spanning all stimuli; the per-stimulus snippets are cut out in memory.
+
+        Parameters
+        ----------
+        trace_name : str, optional
+            The name of the local eod trace, by default None, i.e. will try to read the default from the configuration.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            The local eod snippets, one per stimulus presentation.
+        list of numpy.ndarray
+            The respective time axes, zero at each stimulus onset.
+        """
+        if trace_name is None:
+            trace_name = self._signal_trace_map.get("local eod")
+        if not self._check_trace(trace_name, data_type=DataType.Continuous):
+            logging.warning("EfishEphys.local_eod_all: the local eod trace was not found!")
+            return None, None
+        return self._stimuli_continuous_data(trace_name)
+
+    def eod_times_all(self, trace_name=None):
+        """Return the EOD times for every stimulus presentation. The event trace is read from file only once with a single slice spanning all stimuli; the events are sorted to the stimuli in memory.
+
+        Parameters
+        ----------
+        trace_name : str, optional
+            The name of the recorded event trace that stores the EOD times, by default None, i.e. read trace name from configuration file.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            The EOD times, one array per stimulus presentation, relative to the respective stimulus onset.
+        """
+        if trace_name is None:
+            trace_name = self._signal_trace_map.get("eod times")
+        if not self._check_trace(trace_name, DataType.Event):
+            logging.warning("EfishEphys.eod_times_all: eod times event data was not found in the file. You need to detect them manually.")
+            return None
+        return self._stimuli_event_data(trace_name)
+
     def eod_times(self, stimulus_index=None, trace_name=None):
         """Read the EOD times from file. 
 
@@ -0,0 +1,48 @@
+import numpy as np
+
+from rlxnix.utils.buffers import FeatureBuffer, TraceDataBuffer
+
+
+def test_feature_buffer_lru():
+    buffer = FeatureBuffer()
+    buffer.clear(False)
+    old_size = FeatureBuffer.max_size
+    FeatureBuffer.max_size = 3
+    try:
+        for i in range(5):
+            buffer.put(f"tag_{i}", "feature", np.array([i]))
+        assert not buffer.has("tag_0", "feature")
+        assert not buffer.has("tag_1", "feature")
+        assert buffer.has("tag_2", "feature")
+        assert buffer.has("tag_4", "feature")
+
+        buffer.get("tag_2", "feature")  # refresh, tag_3 becomes the oldest
+        buffer.put("tag_5", "feature", np.array([5]))
+        assert buffer.has("tag_2", "feature")
+        assert not buffer.has("tag_3", "feature")
+    finally:
+        FeatureBuffer.max_size = old_size
+        buffer.clear(False)
+
+
+def test_trace_data_buffer_eviction():
+    buffer = TraceDataBuffer()
+    buffer.clear(False)
+    old_size = TraceDataBuffer.max_size
+    TraceDataBuffer.max_size = 2
+    try:
+        buffer.put(("a",), np.arange(3.), np.arange(3.))
+        buffer.put(("b",), np.arange(3.), None)
+        buffer.put(("c",), np.arange(3.), np.arange(3.))
+        assert not buffer.has(("a",))
+        assert buffer.has(("b",))
+        assert buffer.has(("c",))
+
+        data, time = buffer.get(("c",))
+        assert not data.flags.writeable
+        assert not time.flags.writeable
+        data, time = buffer.get(("b",))
+        assert time is None
+    finally:
+        TraceDataBuffer.max_size = old_size
+        buffer.clear(False)
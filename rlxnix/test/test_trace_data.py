@@ -0,0 +1,57 @@
+import os
+import logging
+import numpy as np
+import rlxnix as rlx
+from rlxnix.base.trace_container import TimeReference
+
+
+def test_batched_readers():
+    filename = os.path.join("..", "..", "data", "2021-11-11-aa.nix")
+    if not os.path.exists(filename):
+        logging.warning(f"file {filename} not found! Skipping test 'test_trace_data.test_batched_readers'")
+        return
+    dataset = rlx.Dataset(filename)
+
+    for repro in dataset.repro_runs():
+        if not hasattr(repro, "eod_all") or len(repro.stimuli) == 0:
+            continue
+        snippets, times = repro.eod_all()
+        for i, (snippet, time) in enumerate(zip(snippets, times)):
+            data, t = repro.eod(stimulus_index=i)
+            assert snippet.shape == data.shape
+            assert np.allclose(snippet, data)
+            assert np.allclose(time, t)
+
+        event_times = repro.eod_times_all()
+        for i, events in enumerate(event_times):
+            single = repro.eod_times(stimulus_index=i)
+            assert events.shape == single.shape
+            assert np.allclose(events, single)
+    dataset.close()
+
+
+def test_trace_data_cache_stability():
+    filename = os.path.join("..", "..", "data", "2021-11-11-aa.nix")
+    if not os.path.exists(filename):
+        logging.warning(f"file {filename} not found! Skipping test 'test_trace_data.test_trace_data_cache_stability'")
+        return
+    dataset = rlx.Dataset(filename)
+
+    stimulus = dataset.repro_runs("Chirps")[0].stimuli[0]
+    data_zero, time_zero = stimulus.trace_data("EOD")
+    data_abs, time_abs = stimulus.trace_data("EOD", reference=TimeReference.Absolute)
+    # repeated calls with alternating references must serve identical results
+    for _ in range(2):
+        data, time = stimulus.trace_data("EOD")
+        assert np.allclose(data, data_zero)
+        assert np.allclose(time, time_zero)
+        data, time = stimulus.trace_data("EOD", reference=TimeReference.Absolute)
+        assert np.allclose(data, data_abs)
+        assert np.allclose(time, time_abs)
+    assert np.allclose(time_abs, time_zero + stimulus.start_time)
+
+    events_zero = stimulus.trace_data("EOD_events")[0]
+    events_abs = stimulus.trace_data("EOD_events", reference=TimeReference.Absolute)[0]
+    assert np.allclose(events_zero, stimulus.trace_data("EOD_events")[0])
+    assert np.allclose(events_abs, events_zero + stimulus.start_time)
+    dataset.close()
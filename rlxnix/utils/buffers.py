@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 
 
 class Singleton(type):
@@ -17,57 +18,97 @@ class MetadataBuffer(metaclass=Singleton):
         self._buffer = {}
 
     def put(self, tag_id, metadata):
-        logging.debug(f"Metadata Buffer: add metadata for tag {tag_id}!")
+        logging.debug("Metadata Buffer: add metadata for tag %s!", tag_id)
         if id not in self._buffer.keys():
             self._buffer[tag_id] = metadata
 
     def has(self, tag_id):
         found = tag_id in self._buffer.keys()
-        logging.debug(f"Metadata Buffer: metadata for tag {tag_id} in buffer: {found}!")
+        logging.debug("Metadata Buffer: metadata for tag %s in buffer: %s!", tag_id, found)
         return found
 
     def get(self, tag_id):
         if self.has(tag_id):
-            logging.debug(f"Metadata Buffer: found metadata for tag {tag_id}!")
+            logging.debug("Metadata Buffer: found metadata for tag %s!", tag_id)
             return self._buffer[tag_id].copy()
         else:
-            logging.debug(f"MetadataBuffer: did not find metadata for tag {tag_id}!")
+            logging.debug("MetadataBuffer: did not find metadata for tag %s!", tag_id)
             return None
 
     def clear(self, show_log=True):
         self._buffer.clear()
         if show_log:
-            logging.debug(f"MetadataBuffer cleared! {len(self._buffer)}")
+            logging.debug("MetadataBuffer cleared! %s", len(self._buffer))
 
 
 class FeatureBuffer(metaclass=Singleton):
+    max_size = 128
+
     def __init__(self) -> None:
         super().__init__()
-        self._buffer = {}
+        self._buffer = OrderedDict()
 
     def put(self, tag_id, feature_name, feature_data):
-        logging.debug(f"FeatureBuffer: add feature data feature {feature_name} for tag {tag_id}!")
-        if tag_id not in self._buffer.keys():
-            self._buffer[tag_id] = {feature_name: feature_data}
+        logging.debug("FeatureBuffer: add feature data feature %s for tag %s!", feature_name, tag_id)
+        key = (tag_id, feature_name)
+        if key not in self._buffer:
+            if len(self._buffer) >= self.max_size:
+                self._buffer.popitem(last=False)
+            self._buffer[key] = feature_data
         else:
-            if feature_name not in self._buffer[tag_id].keys():
-                self._buffer[tag_id][feature_name] = feature_data
+            self._buffer.move_to_end(key)
 
     def has(self, tag_id, feature_name):
-        found = tag_id in self._buffer.keys()
-        found = found and feature_name in self._buffer[tag_id].keys()
-        logging.debug(f"FeatureBuffer: feature data for feature {feature_name} and tag {tag_id} in buffer: {found}!")
+        found = (tag_id, feature_name) in self._buffer
+        logging.debug("FeatureBuffer: feature data for feature %s and tag %s in buffer: %s!", feature_name, tag_id, found)
         return found
 
     def get(self, tag_id, feature_name):
-        if self.has(tag_id, feature_name) :
-            logging.debug(f"FeatureBuffer: found feature data for feature {feature_name} and tag {tag_id}!")
-            return self._buffer[tag_id][feature_name].copy()
+        if self.has(tag_id, feature_name):
+            logging.debug("FeatureBuffer: found feature data for feature %s and tag %s!", feature_name, tag_id)
+            self._buffer.move_to_end((tag_id, feature_name))
+            return self._buffer[(tag_id, feature_name)].copy()
         else:
-            logging.debug(f"FeatureBuffer: did not find Feature {feature_name} for tag {tag_id}!")
+            logging.debug("FeatureBuffer: did not find Feature %s for tag %s!", feature_name, tag_id)
             return None
 
     def clear(self, show_log=True):
         if show_log:
             logging.debug("FeatureBuffer cleared!")
         self._buffer.clear()
+
+
+class TraceDataBuffer(metaclass=Singleton):
+    max_size = 32
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = OrderedDict()
+
+    def put(self, key, data, time=None):
+        logging.debug("TraceDataBuffer: add trace data for key %s!", key)
+        if key not in self._buffer:
+            if len(self._buffer) >= self.max_size:
+                self._buffer.popitem(last=False)
+            data.flags.writeable = False  # entries are handed out without copying
+            if time is not None:
+                time.flags.writeable = False
+            self._buffer[key] = (data, time)
+
+    def has(self, key):
+        found = key in self._buffer
+        logging.debug("TraceDataBuffer: trace data for key %s in buffer: %s!", key, found)
+        return found
+
+    def get(self, key):
+        if self.has(key):
+            logging.debug("TraceDataBuffer: found trace data for key %s!", key)
+            return self._buffer[key]
+        else:
+            logging.debug("TraceDataBuffer: did not find trace data for key %s!", key)
+            return None, None
+
+    def clear(self, show_log=True):
+        if show_log:
+            logging.debug("TraceDataBuffer cleared!")
+        self._buffer.clear()
@@ -15,6 +15,7 @@ class DataTrace(object):
         if (event_type not in t) and (continuous_type not in t):
             raise ValueError(f"DataTrace not valid to dataArrray of type {data_array.type}!")
         self._data_array = data_array
+        self._data_set = data_array._h5group.group["data"]
         self._name = data_array.name
         self._id = data_array.id
         self._type = data_array.type
@@ -85,6 +86,17 @@ class DataTrace(object):
         """
         return self._data_array
 
+    @property
+    def data_set(self):
+        """Returns the h5py dataset underlying the nixio.DataArray. Reading through this handle avoids the per-call lookup through the nixio proxies.
+
+        Returns
+        -------
+        h5py.Dataset
+            The dataset that holds the trace data.
+        """
+        return self._data_set
+
     @property
     def sampling_interval(self):
         """The sampling interval of this trace.
@@ -19,16 +19,30 @@ type_map = {1.0: {DataType.Event: "nix.events.position",
             }
 
 
+# positions and extents per MultiTag id, read once and indexed in memory
+_position_buffer = {}
+
+
+def clear_position_buffer():
+    """Empties the buffered MultiTag positions and extents."""
+    _position_buffer.clear()
+
+
 def tag_start_and_extent(tag, index, mapping_version):
     start_time = None
     duration = None
     if isinstance(tag, nixio.MultiTag):
+        if tag.id not in _position_buffer:
+            positions = tag.positions[:]
+            extents = tag.extents[:] if tag.extents else None
+            _position_buffer[tag.id] = (positions, extents)
+        positions, extents = _position_buffer[tag.id]
         if mapping_version == 1.0:
-            start_time = tag.positions[index][0]
-            duration = tag.extents[index][0] if tag.extents else 0.0
+            start_time = positions[index][0]
+            duration = extents[index][0] if extents is not None else 0.0
         else:
-            start_time = tag.positions[index, 0][0]
-            duration = tag.extents[index, 0][0] if tag.extents else 0.0
+            start_time = positions[index, 0]
+            duration = extents[index, 0] if extents is not None else 0.0
     elif isinstance(tag, nixio.Tag):
         start_time = tag.position[0]
         duration = tag.extent[0] if tag.extent else 0.0